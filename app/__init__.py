@@ -0,0 +1,5 @@
+"""Purser price tracking application."""
+from dotenv import load_dotenv
+
+# Load environment variables once, before any submodule reads them
+load_dotenv()
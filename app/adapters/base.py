@@ -1,14 +1,47 @@
 """Base adapter interface for web scraping."""
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, FrozenSet, Optional
 from playwright.async_api import Page
+from selectolax.parser import HTMLParser
+
+# JS expression collecting every OpenGraph meta tag as {"og:title": ..., "og:image": ...};
+# the first tag wins when a property repeats, like querySelector and read_og_html
+OG_META_JS = (
+    "[...document.querySelectorAll('meta[property^=\"og:\"]')]"
+    ".reduce((og, m) => { const k = m.getAttribute('property'); if (!(k in og)) og[k] = m.content; return og; }, {})"
+)
+
+
+async def read_og(page: Page) -> Dict[str, str]:
+    """Read every OpenGraph meta tag on the page in a single call."""
+    return await page.evaluate(f"() => {OG_META_JS}")
+
+
+def read_og_html(tree: HTMLParser) -> Dict[str, str]:
+    """Read every OpenGraph meta tag from parsed HTML."""
+    og = {}
+    for node in tree.css('meta[property^="og:"]'):
+        og.setdefault(node.attributes.get("property"), node.attributes.get("content"))
+    return og
 
 
 class BaseAdapter(ABC):
     """Base class for all scraping adapters."""
     
-    # List of domains this adapter can handle
-    domains: List[str]
+    # Lowercase domains this adapter handles, without "www."; subdomains match
+    # through their parent. Should be a frozenset; the orchestrator normalizes
+    # whatever iterable is declared to one at registration.
+    domains: FrozenSet[str] = frozenset()
+    
+    # Whether pages must be rendered in a browser; if False, scrape_html is tried first
+    requires_js: bool = False
+    
+    # CSS selector for the element scrape() needs; navigation only waits until it
+    # is attached. None waits for DOMContentLoaded instead.
+    ready_selector: Optional[str] = None
+    
+    # Pages load with images, fonts, media and stylesheets blocked unless this is set
+    needs_images: bool = False
     
     @abstractmethod
     async def scrape(self, page: Page, url: str) -> Dict[str, Any]:
@@ -29,3 +62,17 @@ class BaseAdapter(ABC):
             - flags: dict with keys like free_shipping, accepts_offers, etc.
         """
         pass
+    
+    async def scrape_html(self, html: str, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Scrape product information from server-rendered HTML, without a browser.
+        
+        Args:
+            html: Page HTML fetched over plain HTTP
+            url: The URL being scraped
+            
+        Returns:
+            Same dict as scrape(), or None when the HTML doesn't hold enough
+            data and the page should be rendered in the browser instead
+        """
+        return None
@@ -1,18 +1,112 @@
 """eBay adapter for scraping product information."""
 import re
-from typing import Dict, Any
+import logging
+from typing import Dict, Any, Optional
 from playwright.async_api import Page
+from selectolax.parser import HTMLParser
 
-from .base import BaseAdapter
+from .base import BaseAdapter, OG_META_JS, read_og_html
+
+logger = logging.getLogger(__name__)
+
+# Price patterns paired with their currency, in priority order. Each is searched on its
+# own: fused into one alternation, a lower-priority match can consume the text of a
+# higher-priority one ("20 GBP 15.00" would read as 20 instead of GBP 15.00).
+_PRICE_PATTERNS = [
+    (re.compile(r'US\s*\$(\d+\.?\d*)', re.IGNORECASE), "USD"),
+    (re.compile(r'GBP\s*(\d+\.?\d*)', re.IGNORECASE), "GBP"),
+    (re.compile(r'EUR\s*(\d+\.?\d*)', re.IGNORECASE), "EUR"),
+    (re.compile(r'\$(\d+\.?\d*)', re.IGNORECASE), "USD"),
+    (re.compile(r'(\d+\.?\d*)\s*USD', re.IGNORECASE), "USD"),
+    (re.compile(r'(\d+\.?\d*)\s*GBP', re.IGNORECASE), "GBP"),
+    (re.compile(r'(\d+\.?\d*)\s*EUR', re.IGNORECASE), "EUR"),
+]
+
+# Flag phrases, keyed by the flag each one sets
+_FLAGS_RE = re.compile(
+    r'(?P<free_shipping>free\s+shipping)'
+    r'|(?P<accepts_offers>best\s+offer|make\s+offer)',
+    re.IGNORECASE,
+)
+
+# eBay price selectors, most specific first
+_PRICE_SELECTORS = [
+    "#prcIsum",
+    "[data-testid='x-bin-price']",
+    "[data-testid='x-price-primary']",
+    "#mm-saleDscPrc",
+    "#prcIsum_bidPrice",
+    ".notranslate",
+    ".u-flL.condText"
+]
+
+# Cap on the (lowercased) body text sent back over the wire for price/flag scanning
+_BODY_TEXT_LIMIT = 200000
+
+# Reads everything the adapter needs from the DOM in a single round-trip
+_EBAY_JS = """
+([selectors, bodyLimit]) => {
+    const priceTexts = [];
+    for (const selector of selectors) {
+        const el = document.querySelector(selector);
+        if (el && el.innerText) {
+            priceTexts.push(el.innerText);
+        }
+    }
+    return {
+        og: %s,
+        price_texts: priceTexts,
+        body_text: document.body ? document.body.innerText.slice(0, bodyLimit).toLowerCase() : ""
+    };
+}
+""" % OG_META_JS
 
 
 class EbayAdapter(BaseAdapter):
     """Adapter for eBay product pages."""
     
-    domains = ["ebay.com", "www.ebay.com"]
+    domains = frozenset({"ebay.com", "www.ebay.com"})
+    
+    # Any of the specific price elements (the generic .notranslate/.condText ones appear too early)
+    ready_selector = ", ".join(_PRICE_SELECTORS[:5])
     
     async def scrape(self, page: Page, url: str) -> Dict[str, Any]:
         """Scrape eBay product information."""
+        try:
+            # Read metadata, price candidates and page text in one call
+            data = await page.evaluate(_EBAY_JS, [_PRICE_SELECTORS, _BODY_TEXT_LIMIT])
+            return self._build_result(data)
+            
+        except Exception as e:
+            logger.warning("eBay adapter error for %s: %s", url, e)
+        
+        return self._build_result({})
+    
+    async def scrape_html(self, html: str, url: str) -> Optional[Dict[str, Any]]:
+        """Scrape eBay's server-rendered item page; None if no price was found."""
+        tree = HTMLParser(html)
+        
+        price_texts = []
+        for selector in _PRICE_SELECTORS:
+            node = tree.css_first(selector)
+            text = node.text(separator=" ") if node else ""
+            if text:
+                price_texts.append(text)
+        
+        body_text = ""
+        if tree.body is not None:
+            tree.strip_tags(["script", "style", "noscript"])
+            body_text = tree.body.text(separator=" ")[:_BODY_TEXT_LIMIT].lower()
+        
+        result = self._build_result({
+            "og": read_og_html(tree),
+            "price_texts": price_texts,
+            "body_text": body_text
+        })
+        return result if result["price"] is not None else None
+    
+    def _build_result(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the adapter result from extracted page data."""
         result = {
             "title": None,
             "image_url": None,
@@ -22,69 +116,32 @@ class EbayAdapter(BaseAdapter):
             "flags": {}
         }
         
-        try:
-            # Extract OpenGraph metadata
-            result["title"] = await self._get_meta_property(page, "og:title")
-            result["image_url"] = await self._get_meta_property(page, "og:image")
-            
-            # Extract price using multiple strategies
-            price_info = await self._extract_price(page)
-            if price_info:
-                result["price"] = price_info["price"]
-                result["currency"] = price_info["currency"]
-            
-            # Extract flags
-            result["flags"] = await self._extract_flags(page)
-            
-        except Exception as e:
-            print(f"eBay adapter error for {url}: {e}")
+        # Extract OpenGraph metadata
+        og = data.get("og") or {}
+        result["title"] = og.get("og:title")
+        result["image_url"] = og.get("og:image")
+        
+        # Extract price using multiple strategies
+        price_info = self._extract_price(data)
+        if price_info:
+            result["price"] = price_info["price"]
+            result["currency"] = price_info["currency"]
+        
+        # Extract flags
+        result["flags"] = self._extract_flags(data.get("body_text") or "")
         
         return result
     
-    async def _get_meta_property(self, page: Page, property_name: str) -> str:
-        """Get OpenGraph meta property value."""
-        try:
-            element = await page.query_selector(f'meta[property="{property_name}"]')
-            if element:
-                return await element.get_attribute("content")
-        except:
-            pass
-        return None
-    
-    async def _extract_price(self, page: Page) -> Dict[str, Any]:
+    def _extract_price(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract price using multiple strategies."""
         # Strategy 1: Try specific eBay price selectors
-        price_selectors = [
-            "#prcIsum",
-            "[data-testid='x-bin-price']",
-            "[data-testid='x-price-primary']", 
-            "#mm-saleDscPrc",
-            "#prcIsum_bidPrice",
-            ".notranslate",
-            ".u-flL.condText"
-        ]
-        
-        for selector in price_selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    text = await element.inner_text()
-                    price_info = self._parse_price_text(text)
-                    if price_info:
-                        return price_info
-            except:
-                continue
-        
-        # Strategy 2: Regex over page text
-        try:
-            body_text = await page.inner_text("body")
-            price_info = self._parse_price_text(body_text)
+        for text in data.get("price_texts") or []:
+            price_info = self._parse_price_text(text)
             if price_info:
                 return price_info
-        except:
-            pass
         
-        return None
+        # Strategy 2: Regex over page text
+        return self._parse_price_text(data.get("body_text"))
     
     def _parse_price_text(self, text: str) -> Dict[str, Any]:
         """Parse price from text using regex patterns."""
@@ -94,52 +151,26 @@ class EbayAdapter(BaseAdapter):
         # Clean up text
         text = text.replace(",", "").strip()
         
-        # Price patterns: $123.45, US $123.45, GBP 123.45, EUR 123.45
-        patterns = [
-            r'US\s*\$(\d+\.?\d*)',
-            r'GBP\s*(\d+\.?\d*)', 
-            r'EUR\s*(\d+\.?\d*)',
-            r'\$(\d+\.?\d*)',
-            r'(\d+\.?\d*)\s*USD',
-            r'(\d+\.?\d*)\s*GBP',
-            r'(\d+\.?\d*)\s*EUR'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern, currency in _PRICE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 try:
                     price = float(match.group(1))
                     if price > 0:  # Valid price
-                        currency = "USD"
-                        if "GBP" in pattern.upper():
-                            currency = "GBP"
-                        elif "EUR" in pattern.upper():
-                            currency = "EUR"
                         return {"price": price, "currency": currency}
                 except ValueError:
                     continue
         
         return None
     
-    async def _extract_flags(self, page: Page) -> Dict[str, Any]:
-        """Extract special flags from the page."""
+    def _extract_flags(self, body_text: str) -> Dict[str, Any]:
+        """Extract special flags from the page text."""
         flags = {}
         
-        try:
-            # Get page text for flag detection
-            body_text = await page.inner_text("body")
-            text_lower = body_text.lower()
-            
-            # Check for Best Offer / Make Offer
-            if any(phrase in text_lower for phrase in ["best offer", "make offer"]):
-                flags["accepts_offers"] = True
-            
-            # Check for free shipping
-            if any(phrase in text_lower for phrase in ["free shipping", "free Shipping", "FREE Shipping"]):
-                flags["free_shipping"] = True
-                
-        except Exception as e:
-            print(f"Error extracting flags: {e}")
+        # Free shipping, Best Offer / Make Offer
+        for match in _FLAGS_RE.finditer(body_text):
+            flags[match.lastgroup] = True
+            if len(flags) == len(_FLAGS_RE.groupindex):
+                break
         
         return flags
@@ -1,14 +1,19 @@
 """Generic adapter for fallback scraping."""
-from typing import Dict, Any
+import logging
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
 from playwright.async_api import Page
+from selectolax.parser import HTMLParser
 
-from .base import BaseAdapter
+from .base import BaseAdapter, read_og, read_og_html
+
+logger = logging.getLogger(__name__)
 
 
 class GenericAdapter(BaseAdapter):
     """Generic adapter for any website using OpenGraph metadata."""
     
-    domains = ["*"]  # Matches any domain
+    domains = frozenset({"*"})  # Matches any domain
     
     async def scrape(self, page: Page, url: str) -> Dict[str, Any]:
         """Scrape generic product information using OpenGraph."""
@@ -23,9 +28,10 @@ class GenericAdapter(BaseAdapter):
         
         try:
             # Extract OpenGraph metadata
-            result["title"] = await self._get_meta_property(page, "og:title")
-            result["image_url"] = await self._get_meta_property(page, "og:image")
-            result["site_name"] = await self._get_meta_property(page, "og:site_name")
+            og = await read_og(page)
+            result["title"] = og.get("og:title")
+            result["image_url"] = og.get("og:image")
+            result["site_name"] = og.get("og:site_name")
             
             # Fallback to page title if no og:title
             if not result["title"]:
@@ -33,21 +39,34 @@ class GenericAdapter(BaseAdapter):
             
             # Extract domain as site_name fallback
             if not result["site_name"]:
-                from urllib.parse import urlparse
                 parsed = urlparse(url)
                 result["site_name"] = parsed.netloc.replace('www.', '')
                 
         except Exception as e:
-            print(f"Generic adapter error for {url}: {e}")
+            logger.warning("Generic adapter error for %s: %s", url, e)
         
         return result
     
-    async def _get_meta_property(self, page: Page, property_name: str) -> str:
-        """Get OpenGraph meta property value."""
-        try:
-            element = await page.query_selector(f'meta[property="{property_name}"]')
-            if element:
-                return await element.get_attribute("content")
-        except:
-            pass
-        return None
+    async def scrape_html(self, html: str, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Scrape OpenGraph metadata from server-rendered HTML without a browser.
+        
+        Returns None when the HTML has no og:title, meaning the page likely
+        renders its metadata client-side and needs the Playwright path.
+        """
+        if "og:title" not in html:
+            return None
+        
+        og = read_og_html(HTMLParser(html))
+        title = og.get("og:title")
+        if not title:
+            return None
+        
+        return {
+            "title": title,
+            "image_url": og.get("og:image"),
+            "site_name": og.get("og:site_name") or urlparse(url).netloc.replace('www.', ''),
+            "currency": "USD",
+            "price": None,
+            "flags": {}
+        }
@@ -1,19 +1,40 @@
 """Database configuration and session management."""
 import os
 from sqlmodel import SQLModel, create_engine, Session
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from sqlalchemy import event
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./purser.db")
 
+# Set SQL_ECHO=1 to log every SQL statement while debugging
+SQL_ECHO = os.getenv("SQL_ECHO") == "1"
+
 # Create engine
-engine = create_engine(DATABASE_URL, echo=True)
+engine = create_engine(
+    DATABASE_URL,
+    echo=SQL_ECHO,
+    pool_pre_ping=True,
+    connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
+)
+
+if DATABASE_URL.startswith("sqlite"):
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Let page reads proceed while price checks write, and batch fsyncs."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
 
 def init_db():
-    """Create all tables."""
+    """Create all tables and any indexes missing from existing tables."""
     SQLModel.metadata.create_all(engine)
+    
+    # create_all skips tables that already exist, so add newer indexes explicitly
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
 
 def get_session():
     """Get a database session."""
@@ -1,14 +1,67 @@
 """Email functionality using Gmail SMTP."""
-import smtplib
+import asyncio
+import logging
 import os
+from typing import Optional
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from dotenv import load_dotenv
+import aiosmtplib
 
-# Load environment variables
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-def send_email(to: str, subject: str, html: str) -> bool:
+# Credentials are read once at import (app/__init__.py loads .env)
+_EMAIL_USER = os.getenv("EMAIL_USER")
+_EMAIL_PASS = os.getenv("EMAIL_PASS")
+
+
+class SmtpPool:
+    """Keeps one authenticated SMTP connection open and reuses it across sends."""
+    
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._server: Optional[aiosmtplib.SMTP] = None
+        self._lock = asyncio.Lock()
+    
+    async def _connect(self) -> aiosmtplib.SMTP:
+        """Open a new STARTTLS connection and log in."""
+        server = aiosmtplib.SMTP(hostname=self.host, port=self.port, start_tls=True)
+        await server.connect()
+        await server.login(_EMAIL_USER, _EMAIL_PASS)
+        return server
+    
+    async def _close(self):
+        """Drop the cached connection, ignoring errors from a dead socket."""
+        if self._server is not None:
+            try:
+                await self._server.quit()
+            except (aiosmtplib.SMTPException, OSError):
+                pass
+            self._server = None
+    
+    async def send(self, msg: MIMEMultipart):
+        """Send a message, reconnecting once if the cached connection went stale."""
+        async with self._lock:
+            if self._server is None:
+                self._server = await self._connect()
+            try:
+                await self._server.send_message(msg)
+            except (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPAuthenticationError):
+                await self._close()
+                self._server = await self._connect()
+                await self._server.send_message(msg)
+    
+    async def close(self):
+        """Close the cached connection."""
+        async with self._lock:
+            await self._close()
+
+
+# Shared Gmail connection
+smtp_pool = SmtpPool('smtp.gmail.com', 587)
+
+
+async def send_email(to: str, subject: str, html: str) -> bool:
     """
     Send an email using Gmail SMTP.
     
@@ -21,33 +74,26 @@ def send_email(to: str, subject: str, html: str) -> bool:
         bool: True if email sent successfully, False otherwise
     """
     try:
-        # Get credentials from environment
-        email_user = os.getenv("EMAIL_USER")
-        email_pass = os.getenv("EMAIL_PASS")
-        
-        if not email_user or not email_pass:
-            print("Email credentials not configured")
+        if not _EMAIL_USER or not _EMAIL_PASS:
+            logger.warning("Email credentials not configured")
             return False
         
         # Create message
         msg = MIMEMultipart('alternative')
         msg['Subject'] = subject
-        msg['From'] = email_user
+        msg['From'] = _EMAIL_USER
         msg['To'] = to
         
         # Add HTML content
         html_part = MIMEText(html, 'html')
         msg.attach(html_part)
         
-        # Send email
-        with smtplib.SMTP('smtp.gmail.com', 587) as server:
-            server.starttls()
-            server.login(email_user, email_pass)
-            server.send_message(msg)
+        # Send email over the shared connection
+        await smtp_pool.send(msg)
         
-        print(f"Email sent successfully to {to}")
+        logger.info("Email sent successfully to %s", to)
         return True
         
     except Exception as e:
-        print(f"Failed to send email: {e}")
+        logger.error("Failed to send email: %s", e)
         return False
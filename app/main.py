@@ -1,39 +1,68 @@
 """Main FastAPI application."""
 import os
+import asyncio
 import logging
+import logging.handlers
+import queue
 from datetime import datetime
+from functools import lru_cache
 from urllib.parse import urlparse
-from typing import List
+from typing import List, Optional
 
 from fastapi import FastAPI, Request, Form, Depends
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse
+from jinja2 import FileSystemBytecodeCache
 from sqlmodel import Session, select
+from sqlalchemy import text, delete
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from .db import engine, init_db, get_session
 from .models import Item, Price, Target, Flag
-from .emailer import send_email
-from .scraping import fetch_listing
+from .emailer import send_email, smtp_pool
+from .scraping import fetch_listing, get_orchestrator, close_orchestrator
 
-# Load environment variables
-from dotenv import load_dotenv
-load_dotenv()
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue records unformatted so the listener thread does the formatting."""
+    
+    def prepare(self, record):
+        # The stock prepare() formats the message (and traceback) on the logging
+        # thread; everything stays in-process, so the record can go as-is
+        return record
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging: records are queued, then formatted and written by a
+# background thread, so a burst of scrape failures never blocks the event loop
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+logging.root.addHandler(_DeferredQueueHandler(_log_queue))
+logging.root.setLevel(logging.INFO)
+log_listener.start()
 logger = logging.getLogger(__name__)
 
 # Create FastAPI app
 app = FastAPI(title="Purser", description="Price tracking application")
 
-# Setup templates
+# Set DEBUG=1 to pick up template edits without restarting
+DEBUG = os.getenv("DEBUG") == "1"
+
+# Setup templates: skip per-render mtime checks outside debug and cache compiled bytecode
 templates = Jinja2Templates(directory="app/templates")
+templates.env.auto_reload = DEBUG
+templates.env.bytecode_cache = FileSystemBytecodeCache()
 
 # Scheduler
 scheduler = AsyncIOScheduler()
 
+# Number of items scraped at once during a bulk price check
+SCRAPE_CONCURRENCY = int(os.getenv("SCRAPE_CONCURRENCY", "4"))
+
+# Daily digest time as HH:MM
+DIGEST_TIME_ET = os.getenv("DIGEST_TIME_ET", "09:00")
+
+@lru_cache(maxsize=4096)
 def domain_from_url(url: str) -> str:
     """Extract domain from URL."""
     try:
@@ -63,11 +92,10 @@ async def startup_event():
     )
     
     # Add daily digest job
-    digest_time = os.getenv("DIGEST_TIME_ET", "09:00")
+    digest_hour, digest_minute = DIGEST_TIME_ET.split(':')
     scheduler.add_job(
         send_daily_digest,
-        trigger=CronTrigger(hour=int(digest_time.split(':')[0]), 
-                           minute=int(digest_time.split(':')[1])),
+        trigger=CronTrigger(hour=int(digest_hour), minute=int(digest_minute)),
         id="send_daily_digest",
         name="Send daily price digest"
     )
@@ -76,33 +104,62 @@ async def startup_event():
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Shutdown scheduler."""
+    """Shutdown scheduler, the shared browser and the SMTP connection."""
     scheduler.shutdown()
     logger.info("Scheduler shutdown")
+    
+    await close_orchestrator()
+    logger.info("Browser closed")
+    
+    await smtp_pool.close()
+    
+    # Flush queued log records
+    log_listener.stop()
 
-async def check_all_items():
-    """Check all items for price updates."""
+async def check_all_items(force: bool = False):
+    """Check all items for price updates, reusing recent scrapes unless forced."""
     logger.info("Checking all items for price updates...")
     
     session = get_session()
     try:
         # Get all active items
-        statement = select(Item).where(Item.is_paused == False)
-        items = session.exec(statement).all()
-        
-        for item in items:
-            await check_single_item(item, session)
-            
+        statement = select(Item.id).where(Item.is_paused == False)
+        item_ids = session.exec(statement).all()
     except Exception as e:
         logger.error(f"Error in check_all_items: {e}")
+        return
     finally:
         session.close()
+    
+    semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+    
+    # One timestamp for the whole batch
+    now = datetime.utcnow()
+    
+    async def check_item_id(item_id: int):
+        # Each task gets its own session so concurrent checks don't share state
+        async with semaphore:
+            with get_session() as item_session:
+                item = item_session.get(Item, item_id)
+                if item:
+                    await check_single_item(item, item_session, now, force=force)
+    
+    results = await asyncio.gather(*(check_item_id(item_id) for item_id in item_ids), return_exceptions=True)
+    for item_id, result in zip(item_ids, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error in check_all_items for item {item_id}: {result}")
+    
+    # Cumulative since startup, to judge whether the result cache TTL is paying off
+    logger.info(f"Checked {len(item_ids)} items, scrape cache hit rate {get_orchestrator().cache_hit_rate:.0%}")
 
-async def check_single_item(item: Item, session: Session):
-    """Check a single item for price updates."""
+async def check_single_item(item: Item, session: Session, now: Optional[datetime] = None, force: bool = False):
+    """Check a single item for price updates, stamping changes with `now` (defaults to the current time)."""
+    if now is None:
+        now = datetime.utcnow()
+    
     try:
         # Fetch listing data
-        listing_data = await fetch_listing(item.url)
+        listing_data = await fetch_listing(item.url, force=force)
         
         # Update item with scraped data
         if listing_data.get("title"):
@@ -114,21 +171,32 @@ async def check_single_item(item: Item, session: Session):
         if listing_data.get("currency"):
             item.currency = listing_data["currency"]
         
-        item.updated_at = datetime.utcnow()
+        item.updated_at = now
         session.add(item)
         
         # Save price if found
         price = listing_data.get("price")
         if price is not None:
             price_cents = int(price * 100)  # Convert to cents
-            price_record = Price(
-                item_id=item.id,
-                price_cents=price_cents,
-                currency=listing_data.get("currency", "USD"),
-                fetched_at=datetime.utcnow(),
-                source_confidence=1.0
+            currency = listing_data.get("currency", "USD")
+            
+            # Only record a new history row when the price actually moved
+            last_statement = (
+                select(Price.price_cents, Price.currency)
+                .where(Price.item_id == item.id)
+                .order_by(Price.fetched_at.desc())
+                .limit(1)
             )
-            session.add(price_record)
+            last_price = session.exec(last_statement).first()
+            if last_price is None or tuple(last_price) != (price_cents, currency):
+                price_record = Price(
+                    item_id=item.id,
+                    price_cents=price_cents,
+                    currency=currency,
+                    fetched_at=now,
+                    source_confidence=1.0
+                )
+                session.add(price_record)
             
             logger.info(f"checked item={item.id} domain={item.domain} price={price} {listing_data.get('currency', 'USD')}")
         else:
@@ -157,64 +225,76 @@ async def check_single_item(item: Item, session: Session):
         logger.error(f"Error checking item {item.id}: {e}")
         session.rollback()
 
-def send_daily_digest():
+async def send_daily_digest():
     """Send daily price digest email (placeholder)."""
     logger.info("Sending daily price digest...")
     # TODO: Implement daily digest logic
 
+# Items with their first target, current price and % change since the first price, newest first
+WATCHLIST_ITEMS_SQL = text("""
+    WITH ranked AS (
+        SELECT item_id, price_cents,
+               ROW_NUMBER() OVER (PARTITION BY item_id ORDER BY fetched_at DESC, id DESC) AS rn,
+               FIRST_VALUE(price_cents) OVER (PARTITION BY item_id ORDER BY fetched_at ASC, id ASC) AS first_cents
+        FROM price
+    )
+    SELECT item.id, item.url, item.domain, item.title, item.site_name, item.image_url,
+           target.target_cents,
+           latest.price_cents AS current_cents,
+           CASE WHEN latest.price_cents > 0 AND latest.first_cents > 0
+                THEN (latest.price_cents - latest.first_cents) * 100.0 / latest.first_cents
+           END AS delta_pct
+    FROM item
+    LEFT JOIN target ON target.id = (
+        SELECT MIN(t.id) FROM target AS t WHERE t.item_id = item.id
+    )
+    LEFT JOIN ranked AS latest ON latest.item_id = item.id AND latest.rn = 1
+    ORDER BY item.created_at DESC
+""")
+
+# Each item's last 10 prices in dollars, oldest→newest
+WATCHLIST_SPARKLINE_SQL = text("""
+    WITH latest10 AS (
+        SELECT item_id, price_cents, fetched_at, id,
+               ROW_NUMBER() OVER (PARTITION BY item_id ORDER BY fetched_at DESC, id DESC) AS rn
+        FROM price
+    )
+    SELECT item_id, price_cents / 100.0 AS price
+    FROM latest10
+    WHERE rn <= 10
+    ORDER BY item_id, fetched_at ASC, id ASC
+""")
+
 def build_watchlist_rows(session: Session) -> List[dict]:
     """Build enhanced rows for the watchlist table."""
-    # Get all items
-    statement = select(Item).order_by(Item.created_at.desc())
-    items = session.exec(statement).all()
+    items = session.exec(WATCHLIST_ITEMS_SQL).mappings().all()
     
-    # Build enhanced rows with price calculations
+    # Bucket sparkline values (last up to 10 prices) by item
+    sparkline_data = {}
+    for item_id, price in session.exec(WATCHLIST_SPARKLINE_SQL):
+        sparkline_data.setdefault(item_id, []).append(price)
+    
+    # Build enhanced rows
     rows = []
     for item in items:
-        # Get ordered price history (oldest→newest)
-        price_statement = select(Price).where(Price.item_id == item.id).order_by(Price.fetched_at.asc())
-        prices = session.exec(price_statement).all()
-        
-        # Get target
-        target_statement = select(Target).where(Target.item_id == item.id).limit(1)
-        target = session.exec(target_statement).first()
-        
-        # Compute price metrics
-        current_cents = prices[-1].price_cents if prices else None
-        first_cents = prices[0].price_cents if prices else None
-        
-        # Calculate delta percentage
-        delta_pct_str = "—"
-        if current_cents and first_cents and first_cents > 0:
-            delta_pct = ((current_cents - first_cents) / first_cents) * 100
-            delta_pct_str = f"{delta_pct:+.1f}%"
-        
-        # Build sparkline data (last up to 10 values)
-        sparkline_labels = []
-        sparkline_values = []
-        if prices:
-            # Take last 10 prices
-            recent_prices = prices[-10:]
-            sparkline_labels = [str(i) for i in range(len(recent_prices))]
-            sparkline_values = [float(price.price_cents) / 100.0 for price in recent_prices]  # Convert to USD
-        
-        sparkline = {
-            "labels": sparkline_labels,
-            "data": sparkline_values
-        }
+        data = sparkline_data.get(item["id"], [])
+        delta_pct = item["delta_pct"]
         
         # Build row data
         row = {
-            "id": item.id,
-            "url": item.url,
-            "domain": item.domain,
-            "title": item.title or item.url,
-            "site_name": item.site_name or item.domain,
-            "image_url": item.image_url,
-            "current_cents": current_cents,
-            "target_cents": target.target_cents if target else None,
-            "delta_pct": delta_pct_str,
-            "sparkline": sparkline
+            "id": item["id"],
+            "url": item["url"],
+            "domain": item["domain"],
+            "title": item["title"] or item["url"],
+            "site_name": item["site_name"] or item["domain"],
+            "image_url": item["image_url"],
+            "current_cents": item["current_cents"],
+            "target_cents": item["target_cents"],
+            "delta_pct": f"{delta_pct:+.1f}%" if delta_pct is not None else "—",
+            "sparkline": {
+                "labels": [str(i) for i in range(len(data))],
+                "data": data
+            }
         }
         rows.append(row)
     
@@ -242,12 +322,13 @@ async def add_item(
     domain = domain_from_url(url)
     
     # Create new item
+    now = datetime.utcnow()
     item = Item(
         url=url,
         domain=domain,
         title=url,  # Use URL as title for now
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
+        created_at=now,
+        updated_at=now
     )
     
     session.add(item)
@@ -284,9 +365,9 @@ async def remove_item(
     
     if item:
         # Delete related records first
-        session.exec(select(Price).where(Price.item_id == item_id)).all()
-        session.exec(select(Target).where(Target.item_id == item_id)).all()
-        session.exec(select(Flag).where(Flag.item_id == item_id)).all()
+        session.exec(delete(Price).where(Price.item_id == item_id))
+        session.exec(delete(Target).where(Target.item_id == item_id))
+        session.exec(delete(Flag).where(Flag.item_id == item_id))
         
         # Delete the item
         session.delete(item)
@@ -308,8 +389,8 @@ async def check_now():
     logger.info("Manual price check triggered")
     
     try:
-        # Run the check in the background
-        await check_all_items()
+        # Run the check in the background; repeated clicks are served from the scrape cache
+        await check_all_items(force=False)
         return {"message": "Price check completed", "status": "success"}
     except Exception as e:
         logger.error(f"Error in manual price check: {e}")
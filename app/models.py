@@ -2,6 +2,7 @@
 from datetime import datetime
 from typing import Optional, List
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 
 class Item(SQLModel, table=True):
     """Main item model for tracking products."""
@@ -24,6 +25,11 @@ class Item(SQLModel, table=True):
 
 class Price(SQLModel, table=True):
     """Price history for items."""
+    __table_args__ = (
+        # Serves both "latest price" and "history ordered by time" lookups per item
+        Index("ix_price_item_fetched", "item_id", "fetched_at"),
+    )
+    
     id: Optional[int] = Field(default=None, primary_key=True)
     item_id: int = Field(foreign_key="item.id")
     price_cents: int
@@ -37,7 +43,7 @@ class Price(SQLModel, table=True):
 class Target(SQLModel, table=True):
     """Price targets for items."""
     id: Optional[int] = Field(default=None, primary_key=True)
-    item_id: int = Field(foreign_key="item.id")
+    item_id: int = Field(foreign_key="item.id", index=True)
     target_cents: Optional[int] = None
     rule_name: Optional[str] = None
     
@@ -47,7 +53,7 @@ class Target(SQLModel, table=True):
 class Flag(SQLModel, table=True):
     """Special flags for items (free shipping, offers, etc.)."""
     id: Optional[int] = Field(default=None, primary_key=True)
-    item_id: int = Field(foreign_key="item.id")
+    item_id: int = Field(foreign_key="item.id", index=True)
     free_shipping: Optional[bool] = None
     accepts_offers: Optional[bool] = None
     ending_ts: Optional[datetime] = None
@@ -1,19 +1,224 @@
 """Scraping orchestrator that manages adapters and fetches listing data."""
 import asyncio
-from urllib.parse import urlparse
-from typing import Dict, Any, Optional
-from playwright.async_api import async_playwright, Browser, Page
+import functools
+import logging
+import os
+import random
+from urllib.parse import urlparse, parse_qsl, urlencode
+from typing import Dict, Any, List, Optional, Set, Tuple
+from cachetools import TTLCache
+import httpx
+import psutil
+from playwright.async_api import async_playwright, Playwright, Browser, BrowserContext, Route
+from playwright.async_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 
 from .adapters.base import BaseAdapter
 from .adapters.ebay import EbayAdapter
 from .adapters.generic import GenericAdapter
 
+logger = logging.getLogger(__name__)
+
+# Successful scrapes are reused for this long so back-to-back checks skip the browser
+CACHE_TTL_SECONDS = 300
+CACHE_MAX_ITEMS = 4096
+
+# Browser contexts kept open for reuse (also the cap on concurrent page loads),
+# and how many scrapes a context serves before it is replaced to shed cookies/memory
+CONTEXT_POOL_SIZE = 4
+CONTEXT_MAX_USES = 50
+
+# Long-lived Chromium creeps in memory, so it is relaunched after serving this many
+# page loads, or once its processes' RSS (sampled every few page loads) exceeds the limit
+BROWSER_MAX_SERVED = 1000
+BROWSER_MAX_RSS_MB = int(os.getenv("BROWSER_MAX_RSS_MB", "1500"))
+BROWSER_RSS_CHECK_EVERY = 25
+
+# Extra Chromium switches on top of Playwright's defaults, which already disable the
+# sandbox, /dev/shm, background networking, extensions, audio, Translate and the
+# back-forward cache. Don't add a --disable-features here: Chromium keeps only the
+# last one, which would replace Playwright's own list.
+# Images are blocked by request routing (not imagesEnabled=false) so adapters
+# with needs_images can still load them.
+CHROMIUM_ARGS = [
+    "--disable-gpu"
+]
+
+# Requests aborted in pooled contexts: we only scrape text, so skip heavy assets and trackers
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+BLOCKED_HOSTS = frozenset({
+    "doubleclick.net",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "adservice.google.com",
+    "facebook.net",
+    "scorecardresearch.com",
+    "criteo.com",
+    "hotjar.com"
+})
+
+# Plain HTTP fetch tried before rendering pages for adapters that don't require JS
+STATIC_FETCH_TIMEOUT = 5
+STATIC_PROBE_TTL_SECONDS = 3600
+STATIC_FETCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0 Safari/537.36"
+}
+STATIC_MAX_CONNECTIONS = 100
+STATIC_MAX_KEEPALIVE = 50
+
+# Browser scrapes are retried on transient failures with exponential backoff plus jitter
+RENDER_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.2
+RETRY_JITTER = 0.1
+
+# Playwright timeouts for navigation and for the wait after it (the adapter's ready
+# selector, or DOMContentLoaded), and a hard cap on one whole page load plus scrape,
+# set above both together so it only catches a hung scrape
+NAVIGATION_TIMEOUT_MS = 30000
+READY_TIMEOUT_MS = 15000
+RENDER_TIMEOUT_SECONDS = (NAVIGATION_TIMEOUT_MS + READY_TIMEOUT_MS) // 1000 + 15
+
+# A site that is failing systematically gets one scrape-failure warning per this many
+# seconds; the rest are logged at debug level
+FAILURE_LOG_INTERVAL_SECONDS = 60
+
+
+# Memoized because find_adapter, the static-fetch check and fallbacks all parse the
+# same URL; least-recently-used URLs are evicted once maxsize is reached.
+@functools.lru_cache(maxsize=4096)
+def _extract_domain_cached(url: str) -> str:
+    """Extract domain from URL."""
+    try:
+        # Slice out the host with plain string scans instead of a full urlparse
+        i = url.find("://")
+        start = 0
+        # Only a real scheme counts, not a "://" later on in the query string
+        if i > 0 and all(c.isalnum() or c in "+-." for c in url[:i]):
+            start = i + 3
+        end = len(url)
+        for c in "/?#":
+            j = url.find(c, start, end)
+            if j >= 0:
+                end = j
+        host = url[start:end]
+        # Drop user:pass@ and :port (but not the colons inside an [IPv6] literal)
+        host = host[host.rfind("@") + 1:]
+        k = host.rfind(":")
+        if k > host.rfind("]"):
+            host = host[:k]
+        # Most stored URLs are already lowercase; skip the copy for those
+        if not host.islower():
+            host = host.lower()
+        # Remove www. prefix
+        if host.startswith('www.'):
+            host = host[4:]
+        return host
+    except (ValueError, AttributeError):
+        # Non-string input
+        return "unknown"
+
+
+def _cache_key(url: str) -> str:
+    """Normalize a URL for result caching: host, path and sorted query (no scheme/fragment)."""
+    parsed = urlparse(url)
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return f"{_extract_domain_cached(url)}|{parsed.path or '/'}?{query}"
+
+
+def _is_blocked_host(url: str) -> bool:
+    """Whether a request URL's host (or any parent domain) is on the blocklist."""
+    # Bypass the memo: subresource URLs are mostly one-off and would evict listing URLs
+    domain = _extract_domain_cached.__wrapped__(url)
+    while domain:
+        if domain in BLOCKED_HOSTS:
+            return True
+        dot = domain.find(".")
+        if dot < 0:
+            return False
+        domain = domain[dot + 1:]
+    return False
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Whether a browser failure is transient (timeout or network error) and worth retrying."""
+    if isinstance(exc, PlaywrightTimeoutError):
+        return True
+    # Navigation network failures surface as e.g. "net::ERR_CONNECTION_RESET"
+    return isinstance(exc, PlaywrightError) and "net::ERR_" in str(exc)
+
+
+def _browser_rss_bytes() -> int:
+    """Total RSS of this process's children: the Playwright driver and Chromium's processes."""
+    total = 0
+    for child in psutil.Process().children(recursive=True):
+        try:
+            total += child.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    return total
+
+
+def _make_request_filter(blocked_types: frozenset):
+    """Build a route handler that aborts blocked resource types and hosts."""
+    # Playwright passes (route, request) to handlers with two parameters, so keep it to one
+    async def filter_request(route: Route):
+        request = route.request
+        if request.resource_type in blocked_types or _is_blocked_host(request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+    return filter_request
+
+
+_filter_request = _make_request_filter(BLOCKED_RESOURCE_TYPES)
+
+# Page-level override for adapters that need images (page routes take precedence)
+_filter_request_keep_images = _make_request_filter(BLOCKED_RESOURCE_TYPES - {"image"})
+
 
 class ScrapingOrchestrator:
     """Orchestrates scraping using registered adapters."""
     
-    def __init__(self):
+    def __init__(self, pool_size: int = CONTEXT_POOL_SIZE):
         self.adapters: list[BaseAdapter] = []
+        # Normalized URL -> recent successful result, plus the scrape in flight per URL
+        # so concurrent requests for the same listing share one navigation
+        self._cache: TTLCache = TTLCache(maxsize=CACHE_MAX_ITEMS, ttl=CACHE_TTL_SECONDS)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # Domain -> whether the plain HTTP fetch worked last time; expires so
+        # domains that needed the browser once get re-probed later
+        self._static_ok: TTLCache = TTLCache(maxsize=CACHE_MAX_ITEMS, ttl=STATIC_PROBE_TTL_SECONDS)
+        # Shared HTTP client for the static fast path, created on first use
+        self._http: Optional[httpx.AsyncClient] = None
+        # Shared browser, launched on first use and kept for the life of the process
+        self._pw: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._lock = asyncio.Lock()
+        # Pooled (context, uses) slots; None slots are filled lazily on first use
+        self._ctx_pool: asyncio.Queue = asyncio.Queue(maxsize=pool_size)
+        for _ in range(pool_size):
+            self._ctx_pool.put_nowait((None, 0))
+        self._sem = asyncio.Semaphore(pool_size)
+        # Watchdog state: page loads served by the current browser, whether it is due
+        # for a relaunch, and pages open on it (a relaunch waits for those to finish)
+        self._served = 0
+        self._recycle = False
+        self._open_pages = 0
+        self._pages_idle = asyncio.Event()
+        self._pages_idle.set()
+        # Scrapes are queued and started by a background worker, which drains
+        # everything queued at once while slots are free. Each scrape holds only its
+        # own slot, so one slow page never holds up the rest of the queue. Twice
+        # pool_size lets static fetches and the next pages run while pages render.
+        self._fetch_queue: asyncio.Queue = asyncio.Queue()
+        self._fetch_slots = asyncio.Semaphore(2 * pool_size)
+        self._fetch_tasks: Set[asyncio.Task] = set()
+        self._worker: Optional[asyncio.Task] = None
+        # Domains that logged a scrape-failure warning recently
+        self._failure_logged: TTLCache = TTLCache(maxsize=CACHE_MAX_ITEMS, ttl=FAILURE_LOG_INTERVAL_SECONDS)
         self._register_adapters()
     
     def _register_adapters(self):
@@ -23,69 +228,373 @@ class ScrapingOrchestrator:
         
         # Add generic adapter last as fallback
         self.adapters.append(GenericAdapter())
+        
+        # Index adapters by domain; earlier (more specific) adapters win ties
+        self._domain_map: Dict[str, BaseAdapter] = {}
+        for adapter in self.adapters:
+            # Hold adapters to the frozenset contract even if one declares a list
+            adapter.domains = frozenset(d.lower() for d in getattr(adapter, "domains", ()))
+            for domain in adapter.domains:
+                self._domain_map.setdefault(domain, adapter)
+        self._fallback = self.adapters[-1]  # GenericAdapter is always last
     
     def find_adapter(self, url: str) -> BaseAdapter:
         """Find the best adapter for the given URL."""
         domain = self._extract_domain(url)
         
-        # Try specific adapters first
-        for adapter in self.adapters:
-            if domain in adapter.domains:
+        # Exact domain first, then parent domains (m.ebay.com -> ebay.com)
+        while domain:
+            adapter = self._domain_map.get(domain)
+            if adapter is not None:
                 return adapter
+            dot = domain.find(".")
+            if dot < 0:
+                break
+            domain = domain[dot + 1:]
         
         # Fallback to generic adapter
-        return self.adapters[-1]  # GenericAdapter is always last
+        return self._fallback
     
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL."""
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            # Remove www. prefix
-            if domain.startswith('www.'):
-                domain = domain[4:]
-            return domain
-        except:
-            return "unknown"
-    
-    async def fetch_listing(self, url: str) -> Dict[str, Any]:
+        return _extract_domain_cached(url)
+    
+    async def _get_browser(self) -> Browser:
+        """Return the shared browser, launching Chromium on first use."""
+        # Fast path without the lock once the browser is up
+        browser = self._browser
+        if browser is not None and browser.is_connected() and not self._recycle:
+            return browser
+        
+        async with self._lock:
+            if self._recycle:
+                # Let pages already open on the old browser finish, then close it
+                await self._pages_idle.wait()
+                if self._browser is not None:
+                    browser, self._browser = self._browser, None
+                    try:
+                        await browser.close()
+                    except Exception:
+                        pass
+                self._served = 0
+                self._recycle = False
+                logger.info("browser recycled")
+            
+            # Re-check: a concurrent caller may have launched it while we waited
+            if self._browser is None or not self._browser.is_connected():
+                if self._pw is None:
+                    self._pw = await async_playwright().start()
+                # Launch browser in headless mode
+                self._browser = await self._pw.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+            return self._browser
+    
+    async def aclose(self):
+        """Stop the fetch worker, close the shared browser and stop Playwright."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        for task in list(self._fetch_tasks):
+            task.cancel()
+        
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        
+        async with self._lock:
+            if self._browser is not None:
+                await self._browser.close()
+                self._browser = None
+            if self._pw is not None:
+                await self._pw.stop()
+                self._pw = None
+    
+    async def _acquire_context(self) -> Tuple[BrowserContext, int]:
+        """Take a context from the pool, creating one if the slot is empty or stale."""
+        ctx, uses = await self._ctx_pool.get()
+        if ctx is not None and self._recycle:
+            # The browser is due for a relaunch; don't start new pages on it
+            try:
+                await ctx.close()
+            except Exception:
+                pass
+            ctx = None
+        if ctx is not None and (ctx.browser is None or not ctx.browser.is_connected()):
+            ctx = None
+        if ctx is None:
+            try:
+                browser = await self._get_browser()
+                ctx, uses = await browser.new_context(), 0
+                # Registered once per context, so every page it opens is filtered
+                await ctx.route("**/*", _filter_request)
+            except Exception:
+                # Give the slot back so the pool doesn't shrink
+                self._ctx_pool.put_nowait((None, 0))
+                raise
+        return ctx, uses
+    
+    async def _release_context(self, ctx: BrowserContext, uses: int):
+        """Return a context to the pool, replacing it once it has served enough scrapes."""
+        uses += 1
+        if uses >= CONTEXT_MAX_USES:
+            try:
+                await ctx.close()
+            except Exception:
+                pass
+            ctx, uses = None, 0
+        self._ctx_pool.put_nowait((ctx, uses))
+    
+    async def fetch_listing(self, url: str, force: bool = False) -> Dict[str, Any]:
         """
         Fetch listing data from a URL using the appropriate adapter.
         
         Args:
             url: The URL to scrape
+            force: Skip the result cache and always scrape
             
         Returns:
             Dict with scraped data or fallback data if scraping fails
         """
+        key = _cache_key(url)
+        if not force:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache_hits += 1
+                return cached
+        
+        # Join a scrape of the same listing that is already running, or start one.
+        # The scrape runs in its own task and is shielded, so a cancelled caller
+        # (including the one that started it) doesn't cancel it for the others.
+        task = self._inflight.get(key)
+        if task is None:
+            self._cache_misses += 1
+            task = asyncio.create_task(self._scrape_and_cache(key, url))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._scrape_done, key))
+        return await asyncio.shield(task)
+    
+    async def _scrape_and_cache(self, key: str, url: str) -> Dict[str, Any]:
+        """Scrape a URL for fetch_listing, caching successes and falling back on failure."""
+        result = await self._enqueue_fetch(url)
+        if result is None:
+            return self._get_fallback_result(url)
+        # Only successful scrapes are cached; fallbacks are retried next time
+        self._cache[key] = result
+        return result
+    
+    def _scrape_done(self, key: str, task: asyncio.Task):
+        """Forget a finished in-flight scrape."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark retrieved so a failure nobody waited for isn't logged as never retrieved
+        if not task.cancelled():
+            task.exception()
+    
+    @property
+    def cache_hit_rate(self) -> float:
+        """Share of fetch_listing calls served from the result cache."""
+        total = self._cache_hits + self._cache_misses
+        return self._cache_hits / total if total else 0.0
+    
+    async def _enqueue_fetch(self, url: str) -> Optional[Dict[str, Any]]:
+        """Queue a scrape for the fetch worker and wait for its result."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._fetch_worker())
+        
+        future = asyncio.get_running_loop().create_future()
+        self._fetch_queue.put_nowait((url, future))
+        return await future
+    
+    async def _fetch_worker(self):
+        """Start queued scrapes as soon as a slot is free, taking all that are waiting at once."""
+        while True:
+            await self._fetch_slots.acquire()
+            self._start_fetch(*await self._fetch_queue.get())
+            # acquire() doesn't block while the semaphore isn't locked
+            while not self._fetch_queue.empty() and not self._fetch_slots.locked():
+                await self._fetch_slots.acquire()
+                self._start_fetch(*self._fetch_queue.get_nowait())
+    
+    def _start_fetch(self, url: str, future: asyncio.Future):
+        """Run one queued scrape in its own task."""
+        task = asyncio.create_task(self._run_fetch(url, future))
+        self._fetch_tasks.add(task)
+        task.add_done_callback(self._fetch_tasks.discard)
+    
+    async def _run_fetch(self, url: str, future: asyncio.Future):
+        """Scrape a queued URL, resolve its caller's future and free the slot."""
+        try:
+            result = await self._do_fetch(url)
+            if not future.done():
+                future.set_result(result)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        finally:
+            # If the scrape itself was cancelled (shutdown), don't leave the caller hanging
+            if not future.done():
+                future.cancel()
+            self._fetch_slots.release()
+    
+    async def _do_fetch(self, url: str) -> Optional[Dict[str, Any]]:
+        """Scrape a URL, trying a plain HTTP fetch before the browser; None on failure."""
         adapter = self.find_adapter(url)
         
+        result = await self._fetch_static(adapter, url)
+        if result is None:
+            result = await self._fetch_rendered(adapter, url)
+        return result
+    
+    async def fetch_listings(self, urls: List[str], force: bool = False) -> List[Dict[str, Any]]:
+        """
+        Fetch several listings concurrently on the shared browser.
+        
+        At most pool_size pages load at once; the rest wait for a free context.
+        
+        Args:
+            urls: The URLs to scrape
+            force: Skip the result cache and always scrape
+            
+        Returns:
+            List of results in the same order as urls, with fallback data for failures
+        """
+        results = await asyncio.gather(
+            *(self.fetch_listing(url, force=force) for url in urls),
+            return_exceptions=True
+        )
+        return [
+            # BaseException so a scrape cancelled under us also gets the fallback
+            self._get_fallback_result(url) if isinstance(result, BaseException) else result
+            for url, result in zip(urls, results)
+        ]
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use.
+        
+        One client keeps connections (and TLS sessions) alive across URLs on
+        the same host instead of handshaking for every fetch.
+        """
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                http2=True,
+                timeout=STATIC_FETCH_TIMEOUT,
+                follow_redirects=True,
+                headers=STATIC_FETCH_HEADERS,
+                limits=httpx.Limits(
+                    max_connections=STATIC_MAX_CONNECTIONS,
+                    max_keepalive_connections=STATIC_MAX_KEEPALIVE
+                )
+            )
+        return self._http
+    
+    async def _fetch_static(self, adapter: BaseAdapter, url: str) -> Optional[Dict[str, Any]]:
+        """Scrape server-rendered HTML over plain HTTP, or return None to use the browser."""
+        domain = self._extract_domain(url)
+        if adapter.requires_js or self._static_ok.get(domain) is False:
+            return None
+        
+        result = None
         try:
-            async with async_playwright() as p:
-                # Launch browser in headless mode
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
-                
-                try:
-                    # Navigate to the page
-                    await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                    
-                    # Scrape using the adapter
-                    result = await adapter.scrape(page, url)
-                    
-                    return result
-                    
-                except Exception as e:
-                    print(f"Error scraping {url}: {e}")
-                    # Return fallback result
-                    return self._get_fallback_result(url)
+            response = await self._get_http_client().get(url)
+            if response.status_code == 200:
+                result = await adapter.scrape_html(response.text, url)
+        except Exception:
+            # Network or parse failure: fall back to the browser
+            result = None
+        
+        self._static_ok[domain] = result is not None
+        return result
+    
+    async def _fetch_rendered(self, adapter: BaseAdapter, url: str) -> Optional[Dict[str, Any]]:
+        """Scrape the page in the shared browser, or return None if that fails."""
+        async with self._sem:
+            try:
+                # Borrow a pooled context on the shared browser
+                ctx, uses = await self._acquire_context()
+            except Exception as e:
+                logger.error("browser launch failed url=%s err=%s", url, e)
+                return None
+            
+            self._open_pages += 1
+            self._pages_idle.clear()
+            try:
+                for attempt in range(RENDER_ATTEMPTS):
+                    try:
+                        return await self._render_page(ctx, adapter, url)
+                    except TimeoutError as e:
+                        # Hung past every Playwright timeout; the page is already
+                        # closed, so give up on this URL without retrying. The hung page
+                        # may have left the context in a bad state, so retire it.
+                        self._log_scrape_failure(url, attempt + 1, e)
+                        uses = CONTEXT_MAX_USES
+                        return None
+                    except Exception as e:
+                        if attempt + 1 < RENDER_ATTEMPTS and _is_retryable(e):
+                            await asyncio.sleep(RETRY_BASE_DELAY * 2 ** attempt + random.random() * RETRY_JITTER)
+                            continue
+                        # Only the final failure is reported
+                        self._log_scrape_failure(url, attempt + 1, e)
+                        return None
+            finally:
+                self._open_pages -= 1
+                if self._open_pages == 0:
+                    self._pages_idle.set()
+                await self._release_context(ctx, uses)
+                await self._check_browser_health()
+    
+    async def _check_browser_health(self):
+        """Count a served page load and flag the browser for relaunch once it is due."""
+        self._served += 1
+        if self._recycle:
+            return
+        if self._served >= BROWSER_MAX_SERVED:
+            logger.info("browser served %d page loads, scheduling relaunch", self._served)
+            self._recycle = True
+        elif self._served % BROWSER_RSS_CHECK_EVERY == 0:
+            rss = await asyncio.to_thread(_browser_rss_bytes)
+            if rss > BROWSER_MAX_RSS_MB * 1024 * 1024:
+                logger.info("browser RSS %d MB over limit, scheduling relaunch", rss // (1024 * 1024))
+                self._recycle = True
+    
+    def _log_scrape_failure(self, url: str, attempts: int, error: Exception):
+        """Warn about a failed scrape, at most once per domain per FAILURE_LOG_INTERVAL_SECONDS."""
+        domain = self._extract_domain(url)
+        if domain in self._failure_logged:
+            logger.debug("scrape failed url=%s attempts=%d err=%s", url, attempts, error)
+            return
+        self._failure_logged[domain] = True
+        logger.warning("scrape failed url=%s attempts=%d err=%s", url, attempts, error)
+    
+    async def _render_page(self, ctx: BrowserContext, adapter: BaseAdapter, url: str) -> Optional[Dict[str, Any]]:
+        """Load the URL in a fresh page of the context and run the adapter on it."""
+        page = await ctx.new_page()
+        try:
+            # Playwright's timeouts only cover individual calls; this also bounds
+            # an adapter that hangs inside scrape()
+            try:
+                async with asyncio.timeout(RENDER_TIMEOUT_SECONDS):
+                    if adapter.needs_images:
+                        await page.route("**/*", _filter_request_keep_images)
                     
-                finally:
-                    await browser.close()
+                    # Navigate, then wait only for what the adapter needs
+                    await page.goto(url, wait_until="commit", timeout=NAVIGATION_TIMEOUT_MS)
+                    if adapter.ready_selector:
+                        try:
+                            await page.wait_for_selector(
+                                adapter.ready_selector, state="attached", timeout=READY_TIMEOUT_MS
+                            )
+                        except PlaywrightTimeoutError:
+                            # Scrape whatever has rendered; the adapter has other strategies
+                            pass
+                    else:
+                        await page.wait_for_load_state("domcontentloaded", timeout=READY_TIMEOUT_MS)
                     
-        except Exception as e:
-            print(f"Error launching browser for {url}: {e}")
-            return self._get_fallback_result(url)
+                    # Scrape using the adapter
+                    return await adapter.scrape(page, url)
+            except TimeoutError:
+                # asyncio's TimeoutError has no message; say what timed out
+                raise TimeoutError(f"page load and scrape took over {RENDER_TIMEOUT_SECONDS}s") from None
+        finally:
+            await page.close()
     
     def _get_fallback_result(self, url: str) -> Dict[str, Any]:
         """Get fallback result when scraping fails."""
@@ -100,18 +609,47 @@ class ScrapingOrchestrator:
         }
 
 
-# Global orchestrator instance
-orchestrator = ScrapingOrchestrator()
+# Process-wide orchestrator, created on first use
+_orchestrator: Optional[ScrapingOrchestrator] = None
+
 
+def get_orchestrator() -> ScrapingOrchestrator:
+    """Return the process-wide orchestrator, creating it on first use."""
+    global _orchestrator
+    if _orchestrator is None:
+        _orchestrator = ScrapingOrchestrator()
+    return _orchestrator
 
-async def fetch_listing(url: str) -> Dict[str, Any]:
+
+async def close_orchestrator():
+    """Close the orchestrator's browser if one was ever created (app shutdown hook)."""
+    if _orchestrator is not None:
+        await _orchestrator.aclose()
+
+
+async def fetch_listing(url: str, force: bool = False) -> Dict[str, Any]:
     """
     Convenience function to fetch listing data.
     
     Args:
         url: The URL to scrape
+        force: Skip the result cache and always scrape
         
     Returns:
         Dict with scraped data
     """
-    return await orchestrator.fetch_listing(url)
+    return await get_orchestrator().fetch_listing(url, force=force)
+
+
+async def fetch_listings(urls: List[str], force: bool = False) -> List[Dict[str, Any]]:
+    """
+    Convenience function to fetch several listings concurrently.
+    
+    Args:
+        urls: The URLs to scrape
+        force: Skip the result cache and always scrape
+        
+    Returns:
+        List of dicts with scraped data, in the same order as urls
+    """
+    return await get_orchestrator().fetch_listings(urls, force=force)